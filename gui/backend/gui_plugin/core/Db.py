@@ -95,6 +95,9 @@ class GuiBackendDb():
     def execute(self, sql, params=None):
         return self._db.execute(sql, params)
 
+    def execute_many(self, sql, params_list):
+        return self._db.execute_many(sql, params_list)
+
     def get_last_row_id(self):
         return self._db.get_last_row_id()
 
@@ -138,6 +141,12 @@ class GuiBackendDb():
 
         return Response.standard(status['type'], status['msg'], {"id": last_id})
 
+    def insert_many(self, sql, params_list):
+        """Inserts a row for every parameter set in params_list, all of them
+        in a single transaction"""
+        with BackendTransaction(self):
+            self.execute_many(sql, params_list)
+
     def select(self, sql, params=None, close=None):
         res = None
         rows = []
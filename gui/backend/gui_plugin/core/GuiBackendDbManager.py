@@ -30,6 +30,7 @@ from shutil import copyfile
 from os import path, listdir, rename, remove
 import os
 import stat
+import threading
 import gui_plugin.core.Logger as logger
 from gui_plugin.core.lib.Version import Version
 import contextlib
@@ -42,6 +43,29 @@ OLDEST_SUPPORTED_DB_VERSION = Version((0, 0, 11))
 DEFAULT_CONFIG = {
     "log_rotation_period": 7
 }
+# Settings applied to each database of the backend sessions. The sessions
+# use WAL, so NORMAL synchronization is enough to keep them consistent.
+SQLITE_DATABASE_PRAGMAS = [
+    "synchronous = NORMAL",
+    "cache_size = -64000",
+    "mmap_size = 268435456",
+]
+# Temporary tables and indices are kept in memory unless overridden, e.g.
+# with BACKEND_DB_TEMP_STORE=FILE for large migrations
+SQLITE_TEMP_STORE_VALUES = ["DEFAULT", "FILE", "MEMORY"]
+_temp_store = None
+
+
+def get_sqlite_temp_store():
+    'Returns the temp_store of the backend databases, validated on first use'
+    global _temp_store
+    if _temp_store is None:
+        _temp_store = os.environ.get("BACKEND_DB_TEMP_STORE", "MEMORY").upper()
+        if _temp_store not in SQLITE_TEMP_STORE_VALUES:
+            logger.warning(
+                f"Invalid BACKEND_DB_TEMP_STORE value: {_temp_store}, using MEMORY")
+            _temp_store = "MEMORY"
+    return _temp_store
 
 
 class BackendDbManager():
@@ -53,6 +77,9 @@ class BackendDbManager():
 
     Subclasses of this class handle the specific implementation details
     """
+    # Serializes the deployment and upgrade of the database, since every
+    # backend database session creates its own manager
+    _maintenance_lock = threading.Lock()
 
     def __init__(self, log_rotation=False, session_uuid=None, connection_options=None):
         self._session_uuid = session_uuid
@@ -60,14 +87,18 @@ class BackendDbManager():
 
         self._config = DEFAULT_CONFIG
 
-        self.ensure_database_exists()
+        with BackendDbManager._maintenance_lock:
+            self.ensure_database_exists()
 
         # Log rotation verification should be enabled by the caller
-        # only at specific locations
-        db = self.open_database()
-        if log_rotation and self.check_if_logs_need_rotation(db):
-            self.backup_logs(db)
-        db.close()
+        # only at specific locations, the database is only opened for it then
+        if log_rotation:
+            db = self.open_database()
+            try:
+                if self.check_if_logs_need_rotation(db):
+                    self.backup_logs(db)
+            finally:
+                db.close()
 
     def ensure_database_exists(self):
         if not self.current_database_exist() and not self.check_for_previous_version_and_upgrade():
@@ -136,7 +167,9 @@ class BackendSqliteDbManager(BackendDbManager):
     def open_database(self):
         session_id = f"BackendDB-" + \
             "anonymous" if self._session_uuid is None else self._session_uuid
-        return DbSessionFactory.create("Sqlite", session_id, False, self._connection_options,
+        connection_options = dict(self._connection_options, pragmas=SQLITE_DATABASE_PRAGMAS + [
+            f"temp_store = {get_sqlite_temp_store()}"])
+        return DbSessionFactory.create("Sqlite", session_id, False, connection_options,
                                        None, True, None, None, None, None, None)
 
     def current_database_exist(self):
@@ -209,10 +242,11 @@ class BackendSqliteDbManager(BackendDbManager):
                 f"Copying {installed_db_log_file}.backup to {final_db_log_file}")
             copyfile(f'{installed_db_log_file}.backup', final_db_log_file)
 
+            conn = None
             try:
                 logger.debug2("Start upgrading database")
-                conn = sqlite3.connect(final_db_file)
-                conn.execute("VACUUM")
+                self.vacuum_db(final_db_file)
+                conn = self.connect_db_file(final_db_file)
                 cursor = conn.cursor()
                 for script in upgrade_scripts:
                     with open(path.join(script_dir, script), 'r') as sql_file:
@@ -227,8 +261,9 @@ class BackendSqliteDbManager(BackendDbManager):
                 logger.error(
                     f"Error occurred during database upgrade, rolling back database")
                 logger.exception(e)
-                conn.rollback()
-                conn.close()
+                if conn is not None:
+                    conn.rollback()
+                    conn.close()
                 # move the files back
                 self.remove_db_file(final_db_file)
                 logger.info(
@@ -274,7 +309,7 @@ class BackendSqliteDbManager(BackendDbManager):
 
         try:
             db_file = self._connection_options["db_file"]
-            conn = sqlite3.connect(db_file)
+            conn = self.connect_db_file(db_file)
             os.chmod(db_file, stat.S_IRUSR | stat.S_IWUSR)
             cursor = conn.cursor()
 
@@ -361,6 +396,11 @@ class BackendSqliteDbManager(BackendDbManager):
             db.set_last_error(e)
             db.rollback()
 
+    def connect_db_file(self, db_file):
+        conn = sqlite3.connect(db_file)
+        conn.execute(f"PRAGMA temp_store = {get_sqlite_temp_store()};")
+        return conn
+
     def remove_db_file(self, path):
         self.remove_wal_and_shm_files(path)
         with contextlib.suppress(FileNotFoundError):
@@ -458,6 +498,19 @@ class BackendSqliteDbManager(BackendDbManager):
         dest.close()
         self.remove_wal_and_shm_files(src)
 
+    def vacuum_db(self, db_file):
+        # VACUUM INTO writes the compacted database to a new file that then
+        # replaces the original, instead of rebuilding the database in place
+        vacuumed_db_file = f'{db_file}.vacuum'
+        self.remove_db_file(vacuumed_db_file)
+        conn = self.connect_db_file(db_file)
+        try:
+            conn.execute("VACUUM INTO ?", (vacuumed_db_file,))
+        finally:
+            conn.close()
+        self.remove_wal_and_shm_files(db_file)
+        os.replace(vacuumed_db_file, db_file)
+
     def remove_wal_and_shm_files(self, file):
         with contextlib.suppress(FileNotFoundError):
             remove(f'{file}-shm')
@@ -163,14 +163,21 @@ class DbSqliteSession(DbSession):
             # Cursor to be used for statements from the owner of this instance
             self.cursor = None
 
-            init_cursor = self.conn.execute("PRAGMA journal_mode = WAL")
-            init_cursor.close()
-
             for (database_name, db_file) in self._databases.items():
                 if database_name == self._current_schema:
                     continue
                 self.conn.execute(f"ATTACH '{db_file}' AS '{database_name}';")
 
+            # The pragmas are applied on every open so they are kept when the
+            # session reconnects or changes the active schema
+            pragmas = ["journal_mode = WAL"] + \
+                self._connection_options.get('pragmas', [])
+            for database_name in self._databases:
+                schema = "main" if database_name == self._current_schema else database_name
+                for pragma in pragmas:
+                    init_cursor = self.conn.execute(f"PRAGMA {schema}.{pragma}")
+                    init_cursor.close()
+
             if self._connected_cb is not None and notify_success:
                 self._connected_cb(self)
         except Exception as e:
@@ -211,6 +218,25 @@ class DbSqliteSession(DbSession):
 
         return self.cursor
 
+    def execute_many(self, sql, params_list):
+        """Executes sql once for every parameter set in params_list
+
+        Only available for sessions that are not threaded.
+        """
+        if self.threaded:
+            raise MSGException(Error.CORE_FEATURE_NOT_SUPPORTED,
+                               "execute_many is not supported on threaded sessions.")
+
+        start_time = time.time()
+        try:
+            self.lock()
+            self.cursor = self.conn.cursor().executemany(sql, params_list)
+        finally:
+            self.release()
+        self.update_stats(time.time() - start_time)
+
+        return self.cursor
+
     def _get_stats(self, resultset):
         return {
             "last_insert_id": resultset.lastrowid,
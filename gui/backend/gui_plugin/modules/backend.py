@@ -117,9 +117,8 @@ def get_user_privileges_for_data(db, data_id, user_id):
                             WHERE data_id=?;""",
                      (data_id,)).fetch_all()
 
-    for r in res:
-        sql = f"""INSERT INTO temp.root_folders {ROOT_FOLDERS_SQL}"""
-        db.execute(sql, (r['data_folder_id'], r['read_only']))
+    db.execute_many(f"""INSERT INTO temp.root_folders {ROOT_FOLDERS_SQL}""",
+                    [(r['data_folder_id'], r['read_only']) for r in res])
 
     res = db.execute("""SELECT p.id, rf.read_only
                         FROM profile p
@@ -31,6 +31,13 @@ import pytest
 import re
 
 
+@pytest.fixture(scope="module")
+def backend_db():
+    db = GuiBackendDb()
+    yield db
+    db.close()
+
+
 def test_GuiBackendDb_init():
     backend_db = GuiBackendDb()
     backend_db.select("SELECT * FROM log")
@@ -39,9 +46,7 @@ def test_GuiBackendDb_init():
     backend_db2.select("SELECT * FROM log")
 
 
-def test_GuiBackendDb_commit():
-    backend_db = GuiBackendDb()
-
+def test_GuiBackendDb_commit(backend_db):
     result = backend_db.execute('''SELECT COUNT(*) FROM log''').fetch_one()
     count_step_1 = result[0]
 
@@ -60,14 +65,13 @@ def test_GuiBackendDb_commit():
 
     result = backend_db.execute('''SELECT COUNT(*) FROM log''').fetch_one()
     count_step_3 = result[0]
+    backend_db.rollback()
 
     assert count_step_1 == count_step_2 - 1
     assert count_step_1 == count_step_3
 
 
-def test_GuiBackendDb_rollback():
-    backend_db = GuiBackendDb()
-
+def test_GuiBackendDb_rollback(backend_db):
     result = backend_db.execute('''SELECT COUNT(*) FROM log''').fetch_one()
     count_step_1 = result[0]
 
@@ -83,9 +87,7 @@ def test_GuiBackendDb_rollback():
     assert count_step_1 == count_step_2
 
 
-def test_GuiBackendDb_insert():
-    backend_db = GuiBackendDb()
-
+def test_GuiBackendDb_insert(backend_db):
     result = backend_db.execute('''SELECT COUNT(*) FROM log''').fetch_one()
     count_step_1 = result[0]
 
@@ -110,14 +112,57 @@ def test_GuiBackendDb_insert():
     assert count_step_1 == count_step_3
 
 
-def test_GuiBackendDb_select_rows():
-    backend_db = GuiBackendDb()
+def test_GuiBackendDb_insert_many(backend_db):
+    result = backend_db.execute('''SELECT COUNT(*) FROM log''').fetch_one()
+    count_step_1 = result[0]
+
+    backend_db.insert_many('''INSERT INTO log(event_time, event_type,
+            message) VALUES(?, ?, ?)''',
+                           [(datetime.datetime.now(), 'INFO', '__TEST MESSAGE 1__'),
+                            (datetime.datetime.now(), 'INFO', '__TEST MESSAGE 2__')])
+
+    result = backend_db.execute('''SELECT COUNT(*) FROM log''').fetch_one()
+    count_step_2 = result[0]
+
+    backend_db.start_transaction()
+    backend_db.execute('''DELETE FROM log WHERE message IN (?, ?)''',
+                       ('__TEST MESSAGE 1__', '__TEST MESSAGE 2__'))
+    backend_db.commit()
 
+    result = backend_db.execute('''SELECT COUNT(*) FROM log''').fetch_one()
+    count_step_3 = result[0]
+
+    assert count_step_2 == count_step_1 + 2
+    assert count_step_1 == count_step_3
+
+
+def test_GuiBackendDb_select_rows(backend_db):
     result = backend_db.select('''SELECT * FROM data_category''')
 
     assert len(result) > 0
 
 
+def test_GuiBackendDb_pragmas():
+    backend_db = GuiBackendDb()
+
+    def check_pragmas():
+        for database_name in ["main", "gui_log"]:
+            assert backend_db.execute(
+                f"PRAGMA {database_name}.journal_mode").fetch_one()[0] == "wal"
+            assert backend_db.execute(
+                f"PRAGMA {database_name}.synchronous").fetch_one()[0] == 1
+            assert backend_db.execute(
+                f"PRAGMA {database_name}.cache_size").fetch_one()[0] == -64000
+
+    check_pragmas()
+
+    # The pragmas are applied again when the session reconnects
+    backend_db._db.reconnect()
+    check_pragmas()
+
+    backend_db.close()
+
+
 def test_GuiBackendDb_check_for_previous_version_and_upgrade():
     backend_db = BackendSqliteDbManager()
 
@@ -126,6 +171,11 @@ def test_GuiBackendDb_check_for_previous_version_and_upgrade():
     assert result == True
 
 
+def remove_file(file):
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(file)
+
+
 def test_GuiBackendDb_convert_workbench_sql_file_to_sqlite():
     original_file = os.path.join(
         'gui_plugin', 'internal', 'db_schema', 'mysqlsh_gui_backend_0.0.11.mysql.sql')
@@ -134,14 +184,10 @@ def test_GuiBackendDb_convert_workbench_sql_file_to_sqlite():
     target_file = os.path.join(
         'gui_plugin', 'core', 'db_schema', 'mysqlsh_gui_backend_0.0.99.test.sqlite.sql')
 
-    if os.path.exists(source_file):
-        os.remove(source_file)
+    remove_file(source_file)
+    remove_file(target_file)
 
-    if os.path.exists(target_file):
-        os.remove(target_file)
-
-    assert not os.path.exists(source_file)
-    assert not os.path.exists(target_file)
+    assert not (os.path.exists(source_file) or os.path.exists(target_file))
 
     shutil.copyfile(original_file, source_file)
 
@@ -151,11 +197,8 @@ def test_GuiBackendDb_convert_workbench_sql_file_to_sqlite():
 
     assert os.path.exists(target_file)
 
-    if os.path.exists(source_file):
-        os.remove(source_file)
-
-    if os.path.exists(target_file):
-        os.remove(target_file)
+    remove_file(source_file)
+    remove_file(target_file)
 
 
 def test_convert_all_workbench_sql_files_to_sqlite():
@@ -173,6 +216,17 @@ def test_convert_all_workbench_sql_files_to_sqlite():
     # Verify that DEFAULT NULL is gone
 
 
+def connect_scratch_db(db_file):
+    """Opens a connection to a throwaway database, trading durability for speed"""
+    conn = sqlite3.connect(db_file)
+    cur = conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute("PRAGMA synchronous=OFF")
+    cur.execute("PRAGMA temp_store=MEMORY")
+    cur.execute("PRAGMA cache_size=-65536")
+    return conn
+
+
 def test_upgrade_db():
     current_create_script = os.path.join(
         'gui_plugin', 'core', 'db_schema', f'mysqlsh_gui_backend.sqlite.sql')
@@ -185,7 +239,8 @@ def test_upgrade_db():
     with tempfile.TemporaryDirectory() as tmpdirname:
         current_dump_file = os.path.join(tmpdirname, "current.sql")
         upgraded_dump_file = os.path.join(tmpdirname, "upgraded.sql")
-        conn = sqlite3.connect(os.path.join(tmpdirname, "mysqlsh_gui_backend.sqlite3"))
+        # The current schema is only needed for its dump, so it is built in memory
+        conn = sqlite3.connect(":memory:")
         cur = conn.cursor()
         with open(current_create_script, 'r') as sql_file:
             sql_create = sql_file.read()
@@ -201,11 +256,10 @@ def test_upgrade_db():
 
         conn.close()
 
-        os.remove(os.path.join(tmpdirname, "mysqlsh_gui_backend.sqlite3"))
         with contextlib.suppress(FileNotFoundError):
             os.remove(os.path.join(tmpdirname, "mysqlsh_gui_backend_log.sqlite3"))
 
-        conn = sqlite3.connect(os.path.join(tmpdirname, "mysqlsh_gui_backend_0.0.11.sqlite3"))
+        conn = connect_scratch_db(os.path.join(tmpdirname, "mysqlsh_gui_backend_0.0.11.sqlite3"))
         cur = conn.cursor()
         with open(old_db_create_script, 'r') as sql_file:
             sql_create = sql_file.read()
@@ -69,8 +69,10 @@ def dump(path, **kwargs):
         else:
             export['object'] = lib.dump.get_db_object_dump(session, object_id)
 
+        # Stream the JSON to the file instead of building the whole document
+        # as a string first
         with open(path, 'w') as file:
-            file.write(json.dumps(export, indent=4))
+            json.dump(export, file, indent=4)
 
 
 @plugin_function('mrs.dump.service', shell=True, cli=True, web=True)
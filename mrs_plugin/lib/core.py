@@ -812,6 +812,11 @@ def convert_dict_to_json_string(dic) -> str:
     return json.dumps(dict(dic))
 
 
+def get_sql_placeholders(values) -> str:
+    'Returns a parenthesized list of parameter placeholders for an IN clause'
+    return "(" + ",".join(["?"] * len(values)) + ")"
+
+
 def _generate_where(where):
     if where:
         if isinstance(where, list):
@@ -842,6 +847,7 @@ class MrsDbExec:
     def __init__(self, sql: str, params=[], binary_formatter=None) -> None:
         self._sql = sql
         self._result = None
+        self._items = None
         self._params = params
         self._binary_formatter = binary_formatter
 
@@ -865,6 +871,7 @@ class MrsDbExec:
                 param) for param in self._params]
 
             self._result = session.run_sql(self._sql, self._params)
+            self._items = None
         except Exception as e:
             mysqlsh.globals.shell.log(
                 LogLevel.WARNING.name, f"[{e}\nsql: {self._sql}\nparams: {self._params}")
@@ -876,12 +883,15 @@ class MrsDbExec:
 
     @property
     def items(self):
-        return get_sql_result_as_dict_list(self._result, self._binary_formatter)
+        # The rows can only be fetched once from the result, so they are kept
+        if self._items is None:
+            self._items = get_sql_result_as_dict_list(
+                self._result, self._binary_formatter)
+        return self._items
 
     @property
     def first(self):
-        result = get_sql_result_as_dict_list(
-            self._result, self._binary_formatter)
+        result = self.items
         if not result:
             return None
         return result[0]
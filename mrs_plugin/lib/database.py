@@ -18,6 +18,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, write to the Free Software Foundation, Inc.,
 # 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+from collections import defaultdict
 from mrs_plugin.lib import core
 """
 Module that deals with the "real" database schema instead of the MRS objects
@@ -265,6 +266,25 @@ def get_object_fields_with_references(session, object_id, binary_formatter=None)
 
     return core.MrsDbExec(sql, binary_formatter=binary_formatter).exec(session, [object_id]).items
 
+
+def get_object_fields_with_references_bulk(session, object_ids, binary_formatter=None):
+    """Returns the fields of all the given objects, grouped by object_id"""
+    fields = defaultdict(list)
+    if not object_ids:
+        return fields
+
+    sql = f"""
+        SELECT *
+        FROM `mysql_rest_service_metadata`.`object_fields_with_references`
+        WHERE object_id IN {core.get_sql_placeholders(object_ids)}
+    """
+
+    for field in core.MrsDbExec(sql, binary_formatter=binary_formatter).exec(session, object_ids).items:
+        fields[field["object_id"]].append(field)
+
+    return fields
+
+
 def crud_mapping(crud_operations):
     crud_to_grant_mapping = {
         'CREATE': 'INSERT',
@@ -476,6 +476,10 @@ def get_object_fields_with_references(session, object_id, binary_formatter=None)
     return database.get_object_fields_with_references(session, object_id, binary_formatter=binary_formatter)
 
 
+def get_object_fields_with_references_bulk(session, object_ids, binary_formatter=None):
+    return database.get_object_fields_with_references_bulk(session, object_ids, binary_formatter=binary_formatter)
+
+
 def set_objects(session, db_object_id, objects):
     if objects is None:
         objects = []
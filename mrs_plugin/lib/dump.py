@@ -23,77 +23,134 @@ from mrs_plugin import lib
 from mrs_plugin.lib import core, db_objects
 
 
+def _to_hex_literal(x: bytes) -> str:
+    'Formats binary values, like ids, as hexadecimal literals'
+    return "0x" + x.hex()
+
+
+_MISSING = object()
+
+# Attributes removed from the dumped entries when they are None
+_OBJECT_CLEANUP_FIELDS = ('sdk_options', 'comments')
+_FIELD_CLEANUP_FIELDS = _OBJECT_CLEANUP_FIELDS + (
+    'represents_reference_id', 'parent_reference_id', 'object_reference')
+_OBJECT_REFERENCE_CLEANUP_FIELDS = _OBJECT_CLEANUP_FIELDS + (
+    'reduce_to_value_of_field_id',)
+
+
 def get_object_fields(session, id):
     return lib.core.select('field', where=['db_object_id=?'],
-                           binary_formatter=lambda x: f"0x{x.hex()}").exec(
+                           binary_formatter=_to_hex_literal).exec(
         session, params=[id]).items
 
 
-def cleanup_object(target_object, additional_fields=[]):
-    'Removes attributes from an object if they are None'
-    delete_fields_if_none = ['sdk_options', 'comments']
-    delete_fields_if_none = delete_fields_if_none + additional_fields
-
-    for field in delete_fields_if_none:
-        if field in target_object and target_object[field] is None:
+def _delete_fields_if_none(target_object, fields):
+    'Removes the given attributes from an object if they are None'
+    for field in fields:
+        if target_object.get(field, _MISSING) is None:
             del target_object[field]
 
 
+def cleanup_object(target_object, additional_fields=()):
+    'Removes attributes from an object if they are None'
+    _delete_fields_if_none(target_object, _OBJECT_CLEANUP_FIELDS)
+    _delete_fields_if_none(target_object, additional_fields)
+
+
 def reformat_field(field):
     """Formats a field entry so it matches the field definition used in
-       set_object_fields_with_references'"""
+       set_object_fields_with_references' and returns it"""
 
     # Removes fields not used in input
-    delete_fields = ['caption', 'lev']
-    for name in delete_fields:
-        del field[name]
+    field.pop('caption', None)
+    field.pop('lev', None)
 
     # Removes fields if they are None in field
-    cleanup_object(field, ['represents_reference_id',
-                   'parent_reference_id', 'object_reference'])
+    _delete_fields_if_none(field, _FIELD_CLEANUP_FIELDS)
 
     # Deletes the object reference when it is not really an object reference
     object_reference = field.get('object_reference')
     if object_reference:
         # Removes fields if they are None in object_reference
-        cleanup_object(object_reference, ['reduce_to_value_of_field_id'])
+        _delete_fields_if_none(
+            object_reference, _OBJECT_REFERENCE_CLEANUP_FIELDS)
 
-        if (object_reference.get('reduce_to_value_of_field_id')):
+        reduce_to_value_of_field_id = object_reference.get(
+            'reduce_to_value_of_field_id')
+        if reduce_to_value_of_field_id:
             binary_id = lib.core.id_to_binary(
-                object_reference['reduce_to_value_of_field_id'], 'reduce_to_value_of_field_id')
-            hex_id = lib.core.convert_id_to_string(binary_id)
-            object_reference['reduce_to_value_of_field_id'] = hex_id
+                reduce_to_value_of_field_id, 'reduce_to_value_of_field_id')
+            object_reference['reduce_to_value_of_field_id'] = lib.core.convert_id_to_string(
+                binary_id)
 
         # Inserts the reference object id
         object_reference['id'] = field['represents_reference_id']
 
+    return field
+
+
+def _group_by(items, key):
+    'Groups a list of dicts by the value of the given key, keeping their order'
+    groups = {}
+    for item in items:
+        groups.setdefault(item[key], []).append(item)
+    return groups
+
+
+def _get_objects_dump_by_db_object(session, db_object_ids):
+    """Gets the dumps of the objects associated to the given db_objects
+
+    All objects and fields are fetched with a single statement each and are
+    returned grouped by the formatted id of their db_object.
+    """
+    if not db_object_ids:
+        return {}
 
-def get_object_dump(session, id):
-    'Gets a dump of the objects associated to a db_object'
     objects = lib.core.select(
-        'object', where=['db_object_id=?'],
-        binary_formatter=lambda x: f"0x{x.hex()}").exec(
-        session, params=[id]).items
+        'object', where=[f'db_object_id IN {core.get_sql_placeholders(db_object_ids)}'],
+        binary_formatter=_to_hex_literal).exec(
+        session, params=db_object_ids).items
+
+    if not objects:
+        return {}
+
+    fields_by_object = db_objects.get_object_fields_with_references_bulk(
+        session,
+        [core.id_to_binary(obj['id'], 'object.id') for obj in objects],
+        binary_formatter=_to_hex_literal)
 
     for obj in objects:
         # Removes fields if they are None in object
         cleanup_object(obj)
-        id = core.id_to_binary(obj['id'], 'object.id')
-        obj['fields'] = db_objects.get_object_fields_with_references(
-            session,
-            id,
-            binary_formatter=lambda x: f"0x{x.hex()}")
+        obj['fields'] = [reformat_field(field)
+                         for field in fields_by_object.get(obj['id'], [])]
+
+    return _group_by(objects, 'db_object_id')
+
+
+def _get_db_objects_dump(session, schema_db_objects):
+    'Adds the objects dump to each of the given db_objects'
+    objects_by_db_object = _get_objects_dump_by_db_object(
+        session, [core.id_to_binary(obj['id'], 'db_object.id') for obj in schema_db_objects])
+
+    # A db_object may have one or more associated objects (from the object table)
+    for obj in schema_db_objects:
+        obj["objects"] = objects_by_db_object.get(obj['id'], [])
+
+    return schema_db_objects
 
-        for field in obj['fields']:
-            reformat_field(field)
 
-    return objects
+def get_object_dump(session, id):
+    'Gets a dump of the objects associated to a db_object'
+    id = core.id_to_binary(id, 'db_object.id')
+    return _get_objects_dump_by_db_object(session, [id]).get(
+        core.convert_id_to_string(id), [])
 
 
 def get_db_object_dump(session, id):
     'Gets a dump for a db_object'
     obj = lib.core.select('db_object', where=['id=?'],
-                          binary_formatter=lambda x: f"0x{x.hex()}").exec(
+                          binary_formatter=_to_hex_literal).exec(
         session, params=[id]).first
 
     # A db_object may have one or more associated objects (from the object table)
@@ -104,32 +161,41 @@ def get_db_object_dump(session, id):
 
 def get_db_schema_dump(session, id):
     schema = lib.core.select('db_schema', where=['id=?'],
-                             binary_formatter=lambda x: f"0x{x.hex()}").exec(
+                             binary_formatter=_to_hex_literal).exec(
         session, params=[id]).first
 
-    schema["objects"] = []
-
-    objects = lib.core.select('db_object', cols=['id'], where=['db_schema_id=?']).exec(
+    schema_db_objects = lib.core.select('db_object', where=['db_schema_id=?'],
+                                        binary_formatter=_to_hex_literal).exec(
         session, params=[id]).items
 
-    schema["objects"] = [get_db_object_dump(
-        session, object['id']) for object in objects]
+    schema["objects"] = _get_db_objects_dump(session, schema_db_objects)
 
     return schema
 
 
 def get_service_dump(session, id):
     service = lib.core.select('service', where=['id=?'],
-                              binary_formatter=lambda x: f"0x{x.hex()}").exec(
+                              binary_formatter=_to_hex_literal).exec(
         session, params=[id]).first
 
-    service["schemas"] = []
-
-    schemas = lib.core.select('db_schema', cols=['id'], where=['service_id=?']).exec(
+    service["schemas"] = lib.core.select('db_schema', where=['service_id=?'],
+                                         binary_formatter=_to_hex_literal).exec(
         session, params=[id]).items
 
-    service["schemas"] = [get_db_schema_dump(
-        session, schema['id']) for schema in schemas]
+    if not service["schemas"]:
+        return service
+
+    schema_ids = [core.id_to_binary(schema['id'], 'db_schema.id')
+                  for schema in service["schemas"]]
+    schema_db_objects = lib.core.select(
+        'db_object', where=[f'db_schema_id IN {core.get_sql_placeholders(schema_ids)}'],
+        binary_formatter=_to_hex_literal).exec(
+        session, params=schema_ids).items
+    db_objects_by_schema = _group_by(
+        _get_db_objects_dump(session, schema_db_objects), 'db_schema_id')
+
+    for schema in service["schemas"]:
+        schema["objects"] = db_objects_by_schema.get(schema['id'], [])
 
     return service
 
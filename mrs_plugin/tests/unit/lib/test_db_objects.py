@@ -174,9 +174,32 @@ def test_update_db_object(phone_book, table_contents):
 
                 assert fields == [expected_field]
 
+                fields = lib.db_objects.get_object_fields_with_references_bulk(session, [object["id"]])
+
+                assert fields[object["id"]] == [expected_field]
+
             assert objects == [expected_object]
 
 
+def test_get_object_fields_with_references_bulk(phone_book):
+    session = phone_book["session"]
+    db_object_init1 = get_default_db_object_init(session, phone_book["schema_id"],
+        "ContactsWithEmail", "/view_contacts_with_email")
+    db_object_init2 = get_default_db_object_init(session, phone_book["schema_id"])
+    object_ids = [db_object_init1["objects"][0]["id"], db_object_init2["objects"][0]["id"]]
+
+    with DbObjectCT(session, **db_object_init1), DbObjectCT(session, **db_object_init2):
+        fields = lib.db_objects.get_object_fields_with_references_bulk(session, object_ids)
+
+        assert sorted(fields.keys()) == sorted(object_ids)
+        for object_id in object_ids:
+            assert len(fields[object_id]) == 1
+            assert fields[object_id] == lib.db_objects.get_object_fields_with_references(
+                session, object_id)
+
+    assert lib.db_objects.get_object_fields_with_references_bulk(session, []) == {}
+
+
 def test_get_db_object(phone_book, mobile_phone_book):
 
     with lib.core.MrsDbSession(session=phone_book["session"]) as session:
@@ -0,0 +1,75 @@
+# Copyright (c) 2023, Oracle and/or its affiliates.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2.0,
+# as published by the Free Software Foundation.
+#
+# This program is also distributed with certain software (including
+# but not limited to OpenSSL) that is licensed under separate terms, as
+# designated in a particular file or component or in included license
+# documentation.  The authors of MySQL hereby grant you an additional
+# permission to link the program and your derivative works with the
+# separately licensed software that they have included with MySQL.
+# This program is distributed in the hope that it will be useful,  but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See
+# the GNU General Public License, version 2.0, for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+
+from mrs_plugin import lib
+from ..helpers import DbObjectCT, get_default_db_object_init
+
+
+def test_dump_service(phone_book):
+    session = phone_book["session"]
+    service_id = phone_book["service_id"]
+    db_object_init = get_default_db_object_init(session, phone_book["schema_id"])
+
+    empty_schema_id = lib.schemas.add_schema(session, "EmptyPhoneBook",
+        service_id, "/test_empty_dump", False)
+    try:
+        with DbObjectCT(session, **db_object_init) as db_object_id:
+            service = lib.dump.get_service_dump(session, service_id)
+
+            assert service["id"] == lib.core.convert_id_to_string(service_id)
+
+            schemas = {schema["id"]: schema for schema in service["schemas"]}
+            service_schemas = lib.schemas.get_schemas(session, service_id)
+            assert sorted(schemas.keys()) == sorted(
+                lib.core.convert_id_to_string(schema["id"]) for schema in service_schemas)
+
+            # A schema without db_objects gets an empty list of objects
+            empty_schema = schemas[lib.core.convert_id_to_string(empty_schema_id)]
+            assert empty_schema["objects"] == []
+            assert lib.dump.get_db_schema_dump(session, empty_schema_id) == empty_schema
+
+            schema = schemas[lib.core.convert_id_to_string(phone_book["schema_id"])]
+            assert lib.dump.get_db_schema_dump(session, phone_book["schema_id"]) == schema
+
+            db_objects = {db_object["id"]: db_object for db_object in schema["objects"]}
+            assert lib.core.convert_id_to_string(phone_book["db_object_id"]) in db_objects
+
+            # The db_object created without objects has nothing to dump
+            db_object = db_objects[lib.core.convert_id_to_string(phone_book["db_object_id"])]
+            assert db_object["objects"] == []
+
+            db_object = db_objects[lib.core.convert_id_to_string(db_object_id)]
+            assert lib.dump.get_db_object_dump(session, db_object_id) == db_object
+            assert len(db_object["objects"]) == 1
+
+            obj = db_object["objects"][0]
+            assert obj["db_object_id"] == db_object["id"]
+            assert obj["name"] == "MyServicePhoneBookContactsWithEmail"
+            assert len(obj["fields"]) == 1
+
+            field = obj["fields"][0]
+            assert field["object_id"] == obj["id"]
+            assert field["name"] == "id"
+            assert "caption" not in field
+            assert "lev" not in field
+    finally:
+        lib.schemas.delete_schema(session, empty_schema_id)
+